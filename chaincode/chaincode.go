@@ -10,11 +10,20 @@ import (
 	"fmt"
 	"math/big"
 	"strings"
+	"sync"
 	"time"
 
+	"github.com/hyperledger/fabric-chaincode-go/shim"
 	"github.com/hyperledger/fabric-contract-api-go/contractapi"
 )
 
+// prvKeyCache holds the last parsed PRV public key, keyed by its hex form
+var prvKeyCache struct {
+	sync.RWMutex
+	hex string
+	key *ecdsa.PublicKey
+}
+
 // DFIRChaincode - Public chaincode for evidence management
 type DFIRChaincode struct {
 	contractapi.Contract
@@ -53,6 +62,13 @@ type CustodyTransfer struct {
 	PermitHash    string `json:"permit_hash"`
 }
 
+// CustodyHistoryPage is one page of custody transfers plus the bookmark
+// to pass back for the next page
+type CustodyHistoryPage struct {
+	Transfers []*CustodyTransfer `json:"transfers"`
+	Bookmark  string             `json:"bookmark"`
+}
+
 // JWSPermit from PRV service
 type JWSPermit struct {
 	Header    string `json:"header"`
@@ -208,22 +224,10 @@ func (cc *DFIRChaincode) VerifyPRVPermit(ctx contractapi.TransactionContextInter
 	signData := permit.Header + "." + permit.Payload
 	hash := sha256.Sum256([]byte(signData))
 
-	// Decode public key from hex
-	pubKeyBytes, err := hex.DecodeString(config.PublicKey)
+	// Load PRV public key (parsed once per distinct config key)
+	pubKey, err := parsePRVPublicKey(config.PublicKey)
 	if err != nil {
-		return false, fmt.Errorf("failed to decode public key: %v", err)
-	}
-
-	// Parse uncompressed public key (0x04 + X + Y)
-	x, y := elliptic.Unmarshal(elliptic.P256(), pubKeyBytes)
-	if x == nil {
-		return false, fmt.Errorf("invalid public key format")
-	}
-
-	pubKey := &ecdsa.PublicKey{
-		Curve: elliptic.P256(),
-		X:     x,
-		Y:     y,
+		return false, err
 	}
 
 	// Decode signature from hex
@@ -258,17 +262,10 @@ func (cc *DFIRChaincode) CreateEvidence(ctx contractapi.TransactionContextInterf
 	hash string, location string, metadata string,
 	permitJSON string, nonce string) error {
 
-	// Get caller identity
-	clientID, err := ctx.GetClientIdentity().GetID()
+	// Get caller identity and verify PRV permit
+	clientID, err := cc.authorizeEvidenceAction(ctx, id, "create", permitJSON, nonce)
 	if err != nil {
-		return fmt.Errorf("failed to get client identity: %v", err)
-	}
-
-	// Verify PRV permit
-	resource := fmt.Sprintf("evidence/%s", id)
-	valid, err := cc.VerifyPRVPermit(ctx, permitJSON, clientID, "create", resource, nonce)
-	if err != nil || !valid {
-		return fmt.Errorf("PRV permit verification failed: %v", err)
+		return err
 	}
 
 	// Check if evidence already exists
@@ -316,32 +313,16 @@ func (cc *DFIRChaincode) TransferCustody(ctx contractapi.TransactionContextInter
 	evidenceID string, toCustodian string, reason string, newLocation string,
 	permitJSON string, nonce string) error {
 
-	// Get caller identity
-	clientID, err := ctx.GetClientIdentity().GetID()
+	// Get caller identity and verify PRV permit
+	clientID, err := cc.authorizeEvidenceAction(ctx, evidenceID, "transfer", permitJSON, nonce)
 	if err != nil {
-		return fmt.Errorf("failed to get client identity: %v", err)
-	}
-
-	// Verify PRV permit
-	resource := fmt.Sprintf("evidence/%s", evidenceID)
-	valid, err := cc.VerifyPRVPermit(ctx, permitJSON, clientID, "transfer", resource, nonce)
-	if err != nil || !valid {
-		return fmt.Errorf("PRV permit verification failed: %v", err)
+		return err
 	}
 
 	// Get evidence
-	evidenceJSON, err := ctx.GetStub().GetState(evidenceID)
-	if err != nil {
-		return fmt.Errorf("failed to read evidence: %v", err)
-	}
-	if evidenceJSON == nil {
-		return fmt.Errorf("evidence %s does not exist", evidenceID)
-	}
-
-	var evidence Evidence
-	err = json.Unmarshal(evidenceJSON, &evidence)
+	evidence, err := getEvidence(ctx, evidenceID)
 	if err != nil {
-		return fmt.Errorf("failed to unmarshal evidence: %v", err)
+		return err
 	}
 
 	// Verify current custodian
@@ -350,12 +331,20 @@ func (cc *DFIRChaincode) TransferCustody(ctx contractapi.TransactionContextInter
 			clientID, evidence.Custodian)
 	}
 
+	// Single timestamp for the record, its key and the evidence update,
+	// taken from the transaction so every endorsing peer writes the same value
+	txTimestamp, err := ctx.GetStub().GetTxTimestamp()
+	if err != nil {
+		return fmt.Errorf("failed to get transaction timestamp: %v", err)
+	}
+	now := txTimestamp.Seconds
+
 	// Create custody transfer record
 	transfer := CustodyTransfer{
 		EvidenceID:    evidenceID,
 		FromCustodian: clientID,
 		ToCustodian:   toCustodian,
-		Timestamp:     time.Now().Unix(),
+		Timestamp:     now,
 		Reason:        reason,
 		Location:      newLocation,
 		PermitHash:    hashString(permitJSON),
@@ -367,7 +356,7 @@ func (cc *DFIRChaincode) TransferCustody(ctx contractapi.TransactionContextInter
 	}
 
 	// Store transfer record
-	transferKey := fmt.Sprintf("TRANSFER_%s_%d", evidenceID, time.Now().Unix())
+	transferKey := fmt.Sprintf("TRANSFER_%s_%d", evidenceID, now)
 	err = ctx.GetStub().PutState(transferKey, transferJSON)
 	if err != nil {
 		return fmt.Errorf("failed to store transfer: %v", err)
@@ -376,9 +365,9 @@ func (cc *DFIRChaincode) TransferCustody(ctx contractapi.TransactionContextInter
 	// Update evidence
 	evidence.Custodian = toCustodian
 	evidence.Location = newLocation
-	evidence.Timestamp = time.Now().Unix()
+	evidence.Timestamp = now
 
-	evidenceJSON, err = json.Marshal(evidence)
+	evidenceJSON, err := json.Marshal(evidence)
 	if err != nil {
 		return fmt.Errorf("failed to marshal evidence: %v", err)
 	}
@@ -400,72 +389,35 @@ func (cc *DFIRChaincode) TransferCustody(ctx contractapi.TransactionContextInter
 func (cc *DFIRChaincode) ReadEvidence(ctx contractapi.TransactionContextInterface,
 	id string, permitJSON string, nonce string) (*Evidence, error) {
 
-	// Get caller identity
-	clientID, err := ctx.GetClientIdentity().GetID()
-	if err != nil {
-		return nil, fmt.Errorf("failed to get client identity: %v", err)
-	}
-
-	// Verify PRV permit
-	resource := fmt.Sprintf("evidence/%s", id)
-	valid, err := cc.VerifyPRVPermit(ctx, permitJSON, clientID, "read", resource, nonce)
-	if err != nil || !valid {
-		return nil, fmt.Errorf("PRV permit verification failed: %v", err)
-	}
-
-	evidenceJSON, err := ctx.GetStub().GetState(id)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read evidence: %v", err)
-	}
-	if evidenceJSON == nil {
-		return nil, fmt.Errorf("evidence %s does not exist", id)
-	}
-
-	var evidence Evidence
-	err = json.Unmarshal(evidenceJSON, &evidence)
+	// Verify PRV permit for the caller
+	_, err := cc.authorizeEvidenceAction(ctx, id, "read", permitJSON, nonce)
 	if err != nil {
-		return nil, fmt.Errorf("failed to unmarshal evidence: %v", err)
+		return nil, err
 	}
 
-	return &evidence, nil
+	return getEvidence(ctx, id)
 }
 
 // UpdateEvidenceStatus updates evidence status
 func (cc *DFIRChaincode) UpdateEvidenceStatus(ctx contractapi.TransactionContextInterface,
 	id string, status string, permitJSON string, nonce string) error {
 
-	// Get caller identity
-	clientID, err := ctx.GetClientIdentity().GetID()
-	if err != nil {
-		return fmt.Errorf("failed to get client identity: %v", err)
-	}
-
-	// Verify PRV permit
-	resource := fmt.Sprintf("evidence/%s", id)
-	valid, err := cc.VerifyPRVPermit(ctx, permitJSON, clientID, "update", resource, nonce)
-	if err != nil || !valid {
-		return fmt.Errorf("PRV permit verification failed: %v", err)
-	}
-
-	evidenceJSON, err := ctx.GetStub().GetState(id)
+	// Get caller identity and verify PRV permit
+	clientID, err := cc.authorizeEvidenceAction(ctx, id, "update", permitJSON, nonce)
 	if err != nil {
-		return fmt.Errorf("failed to read evidence: %v", err)
-	}
-	if evidenceJSON == nil {
-		return fmt.Errorf("evidence %s does not exist", id)
+		return err
 	}
 
-	var evidence Evidence
-	err = json.Unmarshal(evidenceJSON, &evidence)
+	evidence, err := getEvidence(ctx, id)
 	if err != nil {
-		return fmt.Errorf("failed to unmarshal evidence: %v", err)
+		return err
 	}
 
 	// Update status
 	evidence.Status = status
 	evidence.Timestamp = time.Now().Unix()
 
-	evidenceJSON, err = json.Marshal(evidence)
+	evidenceJSON, err := json.Marshal(evidence)
 	if err != nil {
 		return fmt.Errorf("failed to marshal evidence: %v", err)
 	}
@@ -496,6 +448,67 @@ func (cc *DFIRChaincode) GetCustodyHistory(ctx contractapi.TransactionContextInt
 	}
 	defer resultsIterator.Close()
 
+	return readTransfers(resultsIterator)
+}
+
+// GetCustodyHistoryWithPagination queries one page of custody transfer history.
+// Pass an empty bookmark for the first page, then the returned bookmark for
+// each following page; stop when the returned bookmark is empty, since
+// passing "" again restarts from the first page
+func (cc *DFIRChaincode) GetCustodyHistoryWithPagination(ctx contractapi.TransactionContextInterface,
+	evidenceID string, pageSize int32, bookmark string) (*CustodyHistoryPage, error) {
+
+	if pageSize <= 0 {
+		return nil, fmt.Errorf("invalid page size: %d", pageSize)
+	}
+
+	// Query using key prefix, resuming after bookmark
+	resultsIterator, metadata, err := ctx.GetStub().GetStateByRangeWithPagination(
+		fmt.Sprintf("TRANSFER_%s_", evidenceID),
+		fmt.Sprintf("TRANSFER_%s_~", evidenceID),
+		pageSize,
+		bookmark,
+	)
+	if err != nil {
+		return nil, fmt.Errorf("failed to query transfers: %v", err)
+	}
+	defer resultsIterator.Close()
+
+	transfers, err := readTransfers(resultsIterator)
+	if err != nil {
+		return nil, err
+	}
+	if transfers == nil {
+		transfers = []*CustodyTransfer{}
+	}
+
+	return &CustodyHistoryPage{
+		Transfers: transfers,
+		Bookmark:  metadata.Bookmark,
+	}, nil
+}
+
+// Helper: resolve the caller and verify their PRV permit for an action on
+// evidence/<id>, returning the caller's client ID
+func (cc *DFIRChaincode) authorizeEvidenceAction(ctx contractapi.TransactionContextInterface,
+	id string, action string, permitJSON string, nonce string) (string, error) {
+
+	clientID, err := ctx.GetClientIdentity().GetID()
+	if err != nil {
+		return "", fmt.Errorf("failed to get client identity: %v", err)
+	}
+
+	resource := "evidence/" + id
+	valid, err := cc.VerifyPRVPermit(ctx, permitJSON, clientID, action, resource, nonce)
+	if err != nil || !valid {
+		return "", fmt.Errorf("PRV permit verification failed: %v", err)
+	}
+
+	return clientID, nil
+}
+
+// Helper: decode custody transfers from a range query iterator
+func readTransfers(resultsIterator shim.StateQueryIteratorInterface) ([]*CustodyTransfer, error) {
 	var transfers []*CustodyTransfer
 	for resultsIterator.HasNext() {
 		queryResponse, err := resultsIterator.Next()
@@ -515,6 +528,63 @@ func (cc *DFIRChaincode) GetCustodyHistory(ctx contractapi.TransactionContextInt
 	return transfers, nil
 }
 
+// Helper: read and decode evidence from world state
+func getEvidence(ctx contractapi.TransactionContextInterface, id string) (*Evidence, error) {
+	evidenceJSON, err := ctx.GetStub().GetState(id)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read evidence: %v", err)
+	}
+	if evidenceJSON == nil {
+		return nil, fmt.Errorf("evidence %s does not exist", id)
+	}
+
+	var evidence Evidence
+	err = json.Unmarshal(evidenceJSON, &evidence)
+	if err != nil {
+		return nil, fmt.Errorf("failed to unmarshal evidence: %v", err)
+	}
+
+	return &evidence, nil
+}
+
+// Helper: decode hex-encoded uncompressed P-256 public key, caching the
+// result so unchanged PRV config is not re-parsed on every transaction
+func parsePRVPublicKey(publicKeyHex string) (*ecdsa.PublicKey, error) {
+	prvKeyCache.RLock()
+	if prvKeyCache.hex == publicKeyHex && prvKeyCache.key != nil {
+		key := prvKeyCache.key
+		prvKeyCache.RUnlock()
+		return key, nil
+	}
+	prvKeyCache.RUnlock()
+
+	// Decode public key from hex
+	pubKeyBytes, err := hex.DecodeString(publicKeyHex)
+	if err != nil {
+		return nil, fmt.Errorf("failed to decode public key: %v", err)
+	}
+
+	// Parse uncompressed public key (0x04 + X + Y)
+	curve := elliptic.P256()
+	x, y := elliptic.Unmarshal(curve, pubKeyBytes)
+	if x == nil {
+		return nil, fmt.Errorf("invalid public key format")
+	}
+
+	key := &ecdsa.PublicKey{
+		Curve: curve,
+		X:     x,
+		Y:     y,
+	}
+
+	prvKeyCache.Lock()
+	prvKeyCache.hex = publicKeyHex
+	prvKeyCache.key = key
+	prvKeyCache.Unlock()
+
+	return key, nil
+}
+
 // Helper: hash string to hex
 func hashString(s string) string {
 	hash := sha256.Sum256([]byte(s))
@@ -2,7 +2,10 @@ module github.com/rae81/Smart-contract/chaincode
 
 go 1.21
 
-require github.com/hyperledger/fabric-contract-api-go v1.2.1
+require (
+	github.com/hyperledger/fabric-chaincode-go v0.0.0-20220920210243-7bc6fa0dd58b
+	github.com/hyperledger/fabric-contract-api-go v1.2.1
+)
 
 require (
 	github.com/go-openapi/jsonpointer v0.19.5 // indirect
@@ -13,7 +16,6 @@ require (
 	github.com/gobuffalo/packd v1.0.0 // indirect
 	github.com/gobuffalo/packr v1.30.1 // indirect
 	github.com/golang/protobuf v1.5.2 // indirect
-	github.com/hyperledger/fabric-chaincode-go v0.0.0-20220920210243-7bc6fa0dd58b // indirect
 	github.com/hyperledger/fabric-protos-go v0.2.0 // indirect
 	github.com/josharian/intern v1.0.0 // indirect
 	github.com/mailru/easyjson v0.7.6 // indirect
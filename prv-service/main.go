@@ -6,10 +6,10 @@ import (
 	"crypto/rand"
 	"crypto/sha256"
 	"encoding/base64"
+	"encoding/hex"
 	"encoding/json"
 	"fmt"
 	"log"
-	"math/big"
 	"net"
 	"strings"
 	"sync"
@@ -18,12 +18,24 @@ import (
 	"google.golang.org/grpc"
 )
 
+// JWS header is identical for every permit, so encode it once
+var jwsHeaderB64 = base64.RawURLEncoding.EncodeToString([]byte(`{"alg":"ES256","typ":"JWT"}`))
+
 // Policy rules structure
 type PolicyRule struct {
 	Role            string
 	ResourcePattern string
 	Action          string
 	MinClearance    int
+	resource        resourceMatcher // Compiled from ResourcePattern
+}
+
+// Pre-split resource pattern so evaluation does no string parsing
+type resourceMatcher struct {
+	pattern  string
+	prefix   string
+	suffix   string
+	wildcard bool
 }
 
 // User role assignment
@@ -33,6 +45,18 @@ type UserRole struct {
 	Clearance int
 }
 
+// Permit payload signed into the JWS (field order fixes the encoded layout)
+type PermitPayload struct {
+	Sub       string `json:"sub"`
+	Action    string `json:"action"`
+	Resource  string `json:"resource"`
+	Clearance uint32 `json:"clearance"`
+	Decision  string `json:"decision"`
+	Timestamp int64  `json:"timestamp"`
+	Nonce     string `json:"nonce"`
+	MREnclave string `json:"mrenclave"`
+}
+
 // PRV Service state (simulated enclave)
 type PRVService struct {
 	UnimplementedPRVServer
@@ -130,6 +154,11 @@ func (s *PRVService) initializePolicies() {
 		{Role: "court", ResourcePattern: "case/*/final", Action: "read", MinClearance: 4},
 	}
 
+	// Compile resource patterns once instead of on every evaluation
+	for i := range s.policies {
+		s.policies[i].resource = compilePattern(s.policies[i].ResourcePattern)
+	}
+
 	log.Printf("Initialized %d policy rules", len(s.policies))
 }
 
@@ -152,6 +181,10 @@ func (s *PRVService) EvaluatePolicy(req *PolicyRequest, stream PRV_EvaluatePolic
 		})
 	}
 
+	// Lowest clearance required by a rule that matched on everything else,
+	// logged once below instead of once per rejected rule
+	neededClearance := 0
+
 	// Evaluate against policies
 	for _, policy := range s.policies {
 		// Check role match
@@ -160,7 +193,7 @@ func (s *PRVService) EvaluatePolicy(req *PolicyRequest, stream PRV_EvaluatePolic
 		}
 
 		// Check resource pattern
-		if !matchPattern(policy.ResourcePattern, req.Resource) {
+		if !policy.resource.match(req.Resource) {
 			continue
 		}
 
@@ -171,8 +204,9 @@ func (s *PRVService) EvaluatePolicy(req *PolicyRequest, stream PRV_EvaluatePolic
 
 		// Check clearance level
 		if user.Clearance < policy.MinClearance {
-			log.Printf("Policy DENY: user %s clearance too low (has %d, needs %d)",
-				req.Subject, user.Clearance, policy.MinClearance)
+			if neededClearance == 0 || policy.MinClearance < neededClearance {
+				neededClearance = policy.MinClearance
+			}
 			continue
 		}
 
@@ -187,6 +221,10 @@ func (s *PRVService) EvaluatePolicy(req *PolicyRequest, stream PRV_EvaluatePolic
 	}
 
 	// No matching policy found - DENY
+	if neededClearance != 0 {
+		log.Printf("Policy DENY: user %s clearance too low (has %d, needs %d)",
+			req.Subject, user.Clearance, neededClearance)
+	}
 	log.Printf("Policy DENY: user=%s action=%s resource=%s (no matching policy)",
 		req.Subject, req.Action, req.Resource)
 
@@ -209,27 +247,22 @@ func (s *PRVService) GetSignedPermit(req *PermitRequest, stream PRV_GetSignedPer
 		req.Subject, req.Action, req.Resource, boolToDecision(req.Allow))
 
 	// Create permit payload
-	payload := map[string]interface{}{
-		"sub":       req.Subject,
-		"action":    req.Action,
-		"resource":  req.Resource,
-		"clearance": req.Clearance,
-		"decision":  boolToDecision(req.Allow),
-		"timestamp": time.Now().Unix(),
-		"nonce":     base64.StdEncoding.EncodeToString(req.Nonce),
-		"mrenclave": fmt.Sprintf("%x", s.mrenclave[:8]), // First 8 bytes as hex
+	payload := PermitPayload{
+		Sub:       req.Subject,
+		Action:    req.Action,
+		Resource:  req.Resource,
+		Clearance: req.Clearance,
+		Decision:  boolToDecision(req.Allow),
+		Timestamp: time.Now().Unix(),
+		Nonce:     base64.StdEncoding.EncodeToString(req.Nonce),
+		MREnclave: hex.EncodeToString(s.mrenclave[:8]), // First 8 bytes as hex
 	}
 
 	payloadJSON, _ := json.Marshal(payload)
 	payloadB64 := base64.RawURLEncoding.EncodeToString(payloadJSON)
 
-	// Create JWS header
-	header := map[string]string{"alg": "ES256", "typ": "JWT"}
-	headerJSON, _ := json.Marshal(header)
-	headerB64 := base64.RawURLEncoding.EncodeToString(headerJSON)
-
 	// Sign: SHA256(header.payload)
-	signData := headerB64 + "." + payloadB64
+	signData := jwsHeaderB64 + "." + payloadB64
 	hash := sha256.Sum256([]byte(signData))
 
 	r, sigS, err := ecdsa.Sign(rand.Reader, s.signingKey, hash[:])
@@ -258,7 +291,7 @@ func (s *PRVService) GetSignedPermit(req *PermitRequest, stream PRV_GetSignedPer
 	rand.Read(attestation.Signature) // Simulated platform signature
 
 	permit := &JWSPermit{
-		Header:    headerB64,
+		Header:    jwsHeaderB64,
 		Payload:   payloadB64,
 		Signature: signature,
 	}
@@ -318,28 +351,39 @@ func (s *PRVService) GetPublicKey(req *PublicKeyRequest, stream PRV_GetPublicKey
 	})
 }
 
-// Helper: simple wildcard pattern matching
-func matchPattern(pattern, resource string) bool {
-	if pattern == resource {
-		return true
-	}
+// Helper: compile a simple wildcard pattern into prefix/suffix form
+func compilePattern(pattern string) resourceMatcher {
+	m := resourceMatcher{pattern: pattern}
 
 	// Handle wildcard at end: "evidence/*"
 	if strings.HasSuffix(pattern, "/*") {
-		prefix := strings.TrimSuffix(pattern, "/*")
-		return strings.HasPrefix(resource, prefix+"/")
+		m.prefix = strings.TrimSuffix(pattern, "/*") + "/"
+		m.wildcard = true
+		return m
 	}
 
 	// Handle wildcard in middle: "evidence/*/approved"
 	if strings.Contains(pattern, "/*") {
 		parts := strings.Split(pattern, "/*")
 		if len(parts) == 2 {
-			return strings.HasPrefix(resource, parts[0]+"/") &&
-				strings.HasSuffix(resource, "/"+parts[1])
+			m.prefix = parts[0] + "/"
+			m.suffix = "/" + parts[1]
+			m.wildcard = true
 		}
 	}
 
-	return false
+	return m
+}
+
+// Helper: match a resource against a compiled pattern
+func (m resourceMatcher) match(resource string) bool {
+	if m.pattern == resource {
+		return true
+	}
+
+	return m.wildcard &&
+		strings.HasPrefix(resource, m.prefix) &&
+		strings.HasSuffix(resource, m.suffix)
 }
 
 // Helper: convert bool to decision string